@@ -9,6 +9,8 @@ import json
 import tempfile
 from pathlib import Path
 
+import numpy as np
+
 # Import our enhanced modules
 from emfdscore.moral_analysis import MoralFrameworkAnalyzer, analyze_text_moral_framework
 from emfdscore.text_extraction import extract_text_from_file, TextExtractionManager
@@ -47,9 +49,9 @@ Durand, an expert in the 3D laser scanning of structures, had arrived in Ukraine
     print(f"\nMoral-to-nonmoral ratio: {moral_ratio:.3f}")
     
     # Find dominant foundation
-    prob_scores = {f: scores.get(f'{f}_p', 0) for f in foundations}
-    dominant = max(prob_scores.items(), key=lambda x: x[1])
-    print(f"Dominant moral foundation: {dominant[0]} ({dominant[1]:.3f})")
+    probs = np.fromiter((scores.get(f'{f}_p', 0.0) for f in foundations), dtype=np.float64, count=len(foundations))
+    dominant = int(probs.argmax())
+    print(f"Dominant moral foundation: {foundations[dominant]} ({probs[dominant]:.3f})")
 
 
 def demo_file_analysis():
@@ -107,24 +109,22 @@ def demo_different_dictionaries():
     
     analyzer = MoralFrameworkAnalyzer()
     
-    # Test different dictionaries
-    for dict_type in ['emfd', 'mfd', 'mfd2']:
+    # Test different dictionaries, tokenizing the text only once
+    try:
+        all_scores = analyzer.analyze_text_multi(text, dict_types=['emfd', 'mfd', 'mfd2'],
+                                                 prob_map='all', output_metrics='sentiment')
+    except Exception as e:
+        print(f"Error scoring dictionaries: {e}")
+        return
+    
+    for dict_type, scores in all_scores.items():
         print(f"\n--- Using {dict_type.upper()} dictionary ---")
-        try:
-            if dict_type == 'emfd':
-                scores = analyzer.analyze_text(text, dict_type=dict_type, prob_map='all', output_metrics='sentiment')
+        print(f"Results using {dict_type}:")
+        for key, value in scores.items():
+            if isinstance(value, (int, float)):
+                print(f"  {key}: {value:.3f}")
             else:
-                scores = analyzer.analyze_text(text, dict_type=dict_type)
-            
-            print(f"Results using {dict_type}:")
-            for key, value in scores.items():
-                if isinstance(value, (int, float)):
-                    print(f"  {key}: {value:.3f}")
-                else:
-                    print(f"  {key}: {value}")
-                    
-        except Exception as e:
-            print(f"Error with {dict_type}: {e}")
+                print(f"  {key}: {value}")
 
 
 def demo_extensible_extraction():
@@ -167,8 +167,10 @@ def demo_extensible_extraction():
     finally:
         # Clean up
         for file_path in test_files:
-            if os.path.exists(file_path):
+            try:
                 os.unlink(file_path)
+            except FileNotFoundError:
+                pass
 
 
 def demo_batch_processing():
@@ -211,8 +213,10 @@ def demo_batch_processing():
     finally:
         # Clean up
         for file_path in test_files:
-            if os.path.exists(file_path):
+            try:
                 os.unlink(file_path)
+            except FileNotFoundError:
+                pass
 
 
 def demo_cli_usage():
@@ -2,17 +2,45 @@
 Moral Analysis module that integrates text extraction with emfdscore moral framework scoring.
 """
 
-import pandas as pd
-import tempfile
+import functools
+import itertools
 import os
-from typing import Dict, Any, Optional, List, Union
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, Optional, List, Union
 import logging
 
 from .text_extraction import TextExtractionManager, extract_text_from_file
-from .scoring import score_docs
+
+# pandas, numpy and the scoring module (spaCy, NLTK and the dictionaries) are
+# imported where they are used, so that importing this module stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Moral foundations and the score keys derived from them
+FOUNDATIONS = ('care', 'fairness', 'loyalty', 'authority', 'sanctity')
+PROB_KEYS = tuple(f"{foundation}_p" for foundation in FOUNDATIONS)
+SENT_KEYS = tuple(f"{foundation}_sent" for foundation in FOUNDATIONS)
+MFD_KEYS = tuple(f"{foundation}.{kind}" for kind in ('virtue', 'vice') for foundation in FOUNDATIONS)
+
+# Scoring methods that reduce all input rows to a single aggregate row
+_AGGREGATE_SCORE_METHODS = ('wordlist', 'gdelt.ngrams')
+
+# Lower bounds of every strength level above 'very_low'
+_STRENGTH_THRESHOLDS = (0.01, 0.05, 0.10, 0.15)
+_STRENGTH_LEVELS = ('very_low', 'low', 'moderate', 'high', 'very_high')
+
+_WORD_RE = re.compile(r'\S+')
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-delimited words without materializing them as a list."""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
 
 class MoralFrameworkAnalyzer:
     """Main class for analyzing moral frameworks in text documents."""
@@ -62,12 +90,25 @@ class MoralFrameworkAnalyzer:
             output_metrics=output_metrics
         )
         
+        return self._file_result(file_path, file_metadata, text, moral_scores,
+                                 dict_type, prob_map, score_method, output_metrics)
+    
+    @staticmethod
+    def _file_result(file_path: str,
+                     file_metadata: Dict[str, Any],
+                     text: str,
+                     moral_scores: Dict[str, Any],
+                     dict_type: str,
+                     prob_map: str,
+                     score_method: str,
+                     output_metrics: str) -> Dict[str, Any]:
+        """Assemble the per-file result dictionary."""
         return {
-            'file_path': file_path,
+            'file_path': os.fspath(file_path),
             'file_metadata': file_metadata,
             'extracted_text': text,
             'text_length': len(text),
-            'word_count': len(text.split()),
+            'word_count': _count_words(text),
             'moral_scores': moral_scores,
             'analysis_parameters': {
                 'dict_type': dict_type,
@@ -143,43 +184,122 @@ class MoralFrameworkAnalyzer:
         if not text.strip():
             raise ValueError("Input text is empty")
         
-        # Create temporary CSV file with the text
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as tmp_file:
-            # Properly escape the text for CSV
-            escaped_text = text.replace('"', '""')
-            tmp_file.write(f'"{escaped_text}"')
-            tmp_csv_path = tmp_file.name
-        
-        try:
-            # Load the CSV into a pandas DataFrame
-            csv_data = pd.read_csv(tmp_csv_path, header=None)
-            num_docs = len(csv_data)
-            
-            logger.info(f"Analyzing text with {dict_type} dictionary using {score_method} method")
-            
-            # Call the emfdscore scoring function
-            if dict_type == 'emfd':
-                df = score_docs(csv_data, dict_type, prob_map, score_method, output_metrics, num_docs)
-            else:
-                # For mfd and mfd2, prob_map and output_metrics are not used
-                # But we still need to pass them to maintain the function signature
-                df = score_docs(csv_data, dict_type, '', score_method, '', num_docs)
+        if score_method not in _AGGREGATE_SCORE_METHODS and not _LETTER_RE.search(text):
+            # No dictionary word can match text without letters, so skip the scoring pipeline
+            from .scoring import zero_scores
             
-            # Convert DataFrame to dictionary
-            if len(df) > 0:
-                scores_dict = df.iloc[0].to_dict()
-                return scores_dict
-            else:
+            scores_dict = zero_scores(dict_type, prob_map, output_metrics)
+            if scores_dict is None:
                 logger.warning("No scores returned from emfdscore")
                 return {}
+            return scores_dict
+        
+        logger.info(f"Analyzing text with {dict_type} dictionary using {score_method} method")
+        
+        try:
+            if score_method in _AGGREGATE_SCORE_METHODS:
+                df = self._score_texts_bulk([text], dict_type, prob_map, score_method, output_metrics)
+                
+                # Convert the first row to a dictionary without building a row Series
+                scores_dict = None
+                if df is not None and len(df) > 0:
+                    scores_dict = dict(zip(df.columns, df.values[0].tolist()))
+            else:
+                # A single document needs no DataFrame on either side of the scorer
+                from .scoring import score_docs_single
                 
+                scores_dict = score_docs_single(text, dict_type, prob_map, output_metrics)
         except Exception as e:
             logger.error(f"Moral framework analysis failed: {e}")
             raise
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_csv_path):
-                os.unlink(tmp_csv_path)
+        
+        if not scores_dict:
+            logger.warning("No scores returned from emfdscore")
+            return {}
+        return scores_dict
+    
+    def analyze_text_multi(self,
+                           text: str,
+                           dict_types: Iterable[str] = ('emfd', 'mfd', 'mfd2'),
+                           prob_map: str = 'all',
+                           score_method: str = 'bow',
+                           output_metrics: str = 'sentiment') -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze raw text against several dictionaries, tokenizing it only once.
+        
+        Args:
+            text: Input text to analyze
+            dict_types: Dictionary types to score against ('emfd', 'mfd', 'mfd2')
+            prob_map: Probability mapping ('all', 'single') - only for emfd
+            score_method: Scoring method ('bow', 'wordlist', 'gdelt.ngrams', 'pat')
+            output_metrics: Output metrics ('sentiment', 'vice-virtue') - only for emfd
+            
+        Returns:
+            Dictionary mapping each dictionary type to its moral framework scores
+        """
+        if not text.strip():
+            raise ValueError("Input text is empty")
+        
+        dict_types = list(dict_types)
+        if score_method in _AGGREGATE_SCORE_METHODS:
+            # These methods do not tokenize, so there is nothing to share
+            return {
+                dict_type: self.analyze_text(text, dict_type, prob_map, score_method, output_metrics)
+                for dict_type in dict_types
+            }
+        
+        import pandas as pd
+        from .scoring import score_docs_multi
+        
+        logger.info(f"Analyzing text with {', '.join(dict_types)} dictionaries using {score_method} method")
+        
+        try:
+            frames = score_docs_multi(pd.DataFrame({0: [text]}), dict_types, prob_map, output_metrics, 1)
+        except Exception as e:
+            logger.error(f"Moral framework analysis failed: {e}")
+            raise
+        
+        if frames is None:
+            logger.warning("No scores returned from emfdscore")
+            return {}
+        return {
+            dict_type: dict(zip(df.columns, df.values[0].tolist())) if len(df) > 0 else {}
+            for dict_type, df in frames.items()
+        }
+    
+    def _score_texts_bulk(self,
+                          texts: List[str],
+                          dict_type: str = 'emfd',
+                          prob_map: str = 'all',
+                          score_method: str = 'bow',
+                          output_metrics: str = 'sentiment') -> Optional['pd.DataFrame']:
+        """
+        Score several texts with a single score_docs call.
+        
+        Args:
+            texts: Input texts, one document each
+            dict_type: Dictionary type ('emfd', 'mfd', 'mfd2')
+            prob_map: Probability mapping ('all', 'single') - only for emfd
+            score_method: Scoring method ('bow', 'wordlist', 'gdelt.ngrams', 'pat')
+            output_metrics: Output metrics ('sentiment', 'vice-virtue') - only for emfd
+            
+        Returns:
+            DataFrame with one row of scores per document (one aggregate row for
+            the wordlist and gdelt.ngrams methods), or None for an invalid configuration
+        """
+        import pandas as pd
+        from .scoring import score_docs
+        
+        # Build the input frame in memory, one document per row
+        csv_data = pd.DataFrame({0: texts})
+        num_docs = len(csv_data)
+        
+        # Call the emfdscore scoring function
+        if dict_type == 'emfd':
+            return score_docs(csv_data, dict_type, prob_map, score_method, output_metrics, num_docs)
+        # For mfd and mfd2, prob_map and output_metrics are not used
+        # But we still need to pass them to maintain the function signature
+        return score_docs(csv_data, dict_type, '', score_method, '', num_docs)
     
     def analyze_text_with_summary(self, 
                                  text: str,
@@ -207,7 +327,7 @@ class MoralFrameworkAnalyzer:
         result = {
             'text': text,
             'text_length': len(text),
-            'word_count': len(text.split()),
+            'word_count': _count_words(text),
             'moral_scores': moral_scores,
             'analysis_parameters': {
                 'dict_type': dict_type,
@@ -235,42 +355,206 @@ class MoralFrameworkAnalyzer:
                      prob_map: str = 'all',
                      score_method: str = 'bow',
                      output_metrics: str = 'sentiment',
+                     max_workers: int = 8,
                      **extraction_kwargs) -> List[Dict[str, Any]]:
         """
         Analyze multiple files in batch.
         
+        Text extraction runs concurrently in a thread pool; scoring then runs
+        once over all successfully extracted texts.
+        
         Args:
-            file_paths: List of file paths to analyze
+            file_paths: List of file paths (or os.scandir() entries) to analyze
             dict_type: Dictionary type ('emfd', 'mfd', 'mfd2')
             prob_map: Probability mapping ('all', 'single') - only for emfd
             score_method: Scoring method ('bow', 'wordlist', 'gdelt.ngrams', 'pat')
             output_metrics: Output metrics ('sentiment', 'vice-virtue') - only for emfd
+            max_workers: Maximum number of files extracted concurrently
             **extraction_kwargs: Additional arguments for text extraction
             
         Returns:
             List of analysis results for each file
         """
-        results = []
-        for file_path in file_paths:
+        return list(self.iter_analyze(
+            file_paths,
+            dict_type=dict_type,
+            prob_map=prob_map,
+            score_method=score_method,
+            output_metrics=output_metrics,
+            max_workers=max_workers,
+            chunk_size=max(len(file_paths), 1),
+            **extraction_kwargs
+        ))
+    
+    def iter_analyze(self,
+                     file_paths: Iterable[str],
+                     dict_type: str = 'emfd',
+                     prob_map: str = 'all',
+                     score_method: str = 'bow',
+                     output_metrics: str = 'sentiment',
+                     max_workers: int = 8,
+                     chunk_size: int = 32,
+                     **extraction_kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Analyze files lazily, yielding one result per file in input order.
+        
+        Files are processed in chunks: each chunk is extracted concurrently and
+        scored with a single score_docs call, and its results are yielded before
+        the next chunk is read. Peak memory is bounded by one chunk rather than
+        the whole corpus, as long as the caller does not keep every result.
+        
+        Args:
+            file_paths: Iterable of file paths (or os.scandir() entries) to analyze
+            dict_type: Dictionary type ('emfd', 'mfd', 'mfd2')
+            prob_map: Probability mapping ('all', 'single') - only for emfd
+            score_method: Scoring method ('bow', 'wordlist', 'gdelt.ngrams', 'pat')
+            output_metrics: Output metrics ('sentiment', 'vice-virtue') - only for emfd
+            max_workers: Maximum number of files extracted concurrently; above 1,
+                each PDF is extracted without its own page pool unless num_workers
+                is passed explicitly
+            chunk_size: Number of files extracted and scored together
+            **extraction_kwargs: Additional arguments for text extraction
+            
+        Yields:
+            Analysis result for each file, shaped like analyze_batch entries
+        """
+        if max_workers > 1:
+            # Files are already extracted in parallel threads; per-document process pools
+            # would be forked from a multi-threaded process and multiply the worker count
+            extraction_kwargs.setdefault('num_workers', 1)
+        file_paths = iter(file_paths)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                chunk = list(itertools.islice(file_paths, chunk_size))
+                if not chunk:
+                    break
+                yield from self._analyze_chunk(executor, chunk, dict_type, prob_map,
+                                               score_method, output_metrics, extraction_kwargs)
+    
+    def _analyze_chunk(self,
+                       executor: ThreadPoolExecutor,
+                       file_paths: List[str],
+                       dict_type: str,
+                       prob_map: str,
+                       score_method: str,
+                       output_metrics: str,
+                       extraction_kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Extract a chunk of files concurrently and score their texts together."""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(file_paths)
+        
+        # Extract every file first so that scoring can run once for the whole chunk
+        extracted = []
+        futures = {
+            executor.submit(self._extract_with_metadata, file_path, extraction_kwargs): index
+            for index, file_path in enumerate(file_paths)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            file_path = file_paths[index]
+            try:
+                text, file_metadata = future.result()
+                extracted.append((index, file_path, text, file_metadata))
+            except Exception as e:
+                logger.error(f"Failed to analyze {os.fspath(file_path)}: {e}")
+                results[index] = self._batch_error(file_path, e)
+        extracted.sort(key=lambda item: item[0])
+        
+        if extracted:
+            texts = [text for _, _, text, _ in extracted]
             try:
-                result = self.analyze_file(
-                    file_path,
-                    dict_type=dict_type,
-                    prob_map=prob_map,
-                    score_method=score_method,
-                    output_metrics=output_metrics,
-                    **extraction_kwargs
-                )
-                results.append(result)
+                if score_method in _AGGREGATE_SCORE_METHODS:
+                    # These methods collapse all rows into one, so score each text on its own
+                    all_scores = [
+                        self.analyze_text(text, dict_type, prob_map, score_method, output_metrics)
+                        for text in texts
+                    ]
+                else:
+                    logger.info(f"Analyzing {len(texts)} texts with {dict_type} dictionary using {score_method} method")
+                    df = self._score_texts_bulk(texts, dict_type, prob_map, score_method, output_metrics)
+                    if df is None or len(df) != len(texts):
+                        raise ValueError("emfdscore did not return one score row per document")
+                    all_scores = df.to_dict('records')
             except Exception as e:
-                logger.error(f"Failed to analyze {file_path}: {e}")
-                results.append({
-                    'file_path': file_path,
-                    'error': str(e),
-                    'moral_scores': {}
-                })
+                logger.error(f"Moral framework analysis failed: {e}")
+                for index, file_path, _, _ in extracted:
+                    results[index] = self._batch_error(file_path, e)
+            else:
+                for (index, file_path, text, file_metadata), moral_scores in zip(extracted, all_scores):
+                    results[index] = self._file_result(file_path, file_metadata, text, moral_scores,
+                                                       dict_type, prob_map, score_method, output_metrics)
+        
         return results
     
+    def analyze_batch_frame(self,
+                            file_paths: List[str],
+                            dict_type: str = 'emfd',
+                            prob_map: str = 'all',
+                            score_method: str = 'bow',
+                            output_metrics: str = 'sentiment',
+                            max_workers: int = 8,
+                            **extraction_kwargs) -> 'pd.DataFrame':
+        """
+        Analyze multiple files in batch and return the results as one DataFrame.
+        
+        Each row holds one file: its path, the error message (None on success),
+        text length, word count, scalar file metadata and one column per moral
+        score, so that batch-wide statistics can be computed column-wise.
+        
+        Args:
+            file_paths: List of file paths (or os.scandir() entries) to analyze
+            dict_type: Dictionary type ('emfd', 'mfd', 'mfd2')
+            prob_map: Probability mapping ('all', 'single') - only for emfd
+            score_method: Scoring method ('bow', 'wordlist', 'gdelt.ngrams', 'pat')
+            output_metrics: Output metrics ('sentiment', 'vice-virtue') - only for emfd
+            max_workers: Maximum number of files extracted concurrently
+            **extraction_kwargs: Additional arguments for text extraction
+            
+        Returns:
+            DataFrame with one row per input file, in input order
+        """
+        results = self.analyze_batch(
+            file_paths,
+            dict_type=dict_type,
+            prob_map=prob_map,
+            score_method=score_method,
+            output_metrics=output_metrics,
+            max_workers=max_workers,
+            **extraction_kwargs
+        )
+        
+        import pandas as pd
+        
+        rows = []
+        for result in results:
+            row = {'file_path': result['file_path'], 'error': result.get('error')}
+            if 'error' not in result:
+                row['text_length'] = result['text_length']
+                row['word_count'] = result['word_count']
+                # Nested metadata such as the PDF info dictionary does not fit a column
+                row.update((key, value) for key, value in result['file_metadata'].items()
+                           if not isinstance(value, dict))
+                row.update(result['moral_scores'])
+            rows.append(row)
+        return pd.DataFrame(rows)
+    
+    def _extract_with_metadata(self, file_path: str, extraction_kwargs: Dict[str, Any]):
+        """Extract the text and metadata of a single batch file."""
+        # Batch results are yielded chunk by chunk; caching every text would keep
+        # the most recent documents resident and defeat the bounded peak memory
+        text = self.text_manager.extract_text(file_path, **{'use_cache': False, **extraction_kwargs})
+        if not text.strip():
+            raise ValueError("Input text is empty")
+        return text, self.text_manager.get_file_metadata(file_path)
+    
+    @staticmethod
+    def _batch_error(file_path: str, error: Exception) -> Dict[str, Any]:
+        """Build the result entry for a file that could not be analyzed."""
+        return {
+            'file_path': os.fspath(file_path),
+            'error': str(error),
+            'moral_scores': {}
+        }
+    
     def get_moral_summary(self, scores: Dict[str, Any], dict_type: str = 'emfd') -> Dict[str, Any]:
         """
         Generate a human-readable summary of moral framework scores.
@@ -288,35 +572,38 @@ class MoralFrameworkAnalyzer:
         }
         
         if dict_type == 'emfd':
-            foundations = ['care', 'fairness', 'loyalty', 'authority', 'sanctity']
+            import numpy as np
             
             # Extract probability scores
             prob_scores = {}
             sent_scores = {}
             
-            for foundation in foundations:
-                prob_key = f"{foundation}_p"
-                sent_key = f"{foundation}_sent"
-                
+            for foundation, prob_key, sent_key in zip(FOUNDATIONS, PROB_KEYS, SENT_KEYS):
                 if prob_key in scores:
                     prob_scores[foundation] = scores[prob_key]
                 if sent_key in scores:
                     sent_scores[foundation] = scores[sent_key]
             
+            prob_names = list(prob_scores)
+            prob_values = np.fromiter(prob_scores.values(), dtype=np.float64, count=len(prob_names))
+            
             # Find dominant moral foundation
-            if prob_scores:
-                dominant_foundation = max(prob_scores.items(), key=lambda x: x[1])
+            if prob_names:
+                dominant_index = int(prob_values.argmax())
                 summary['dominant_foundation'] = {
-                    'name': dominant_foundation[0],
-                    'probability': dominant_foundation[1]
+                    'name': prob_names[dominant_index],
+                    'probability': float(prob_values[dominant_index])
                 }
             
+            # Categorize all probabilities in one pass
+            strengths = dict(zip(prob_names, self._categorize_scores(prob_values)))
+            
             # Summarize each foundation
-            for foundation in foundations:
+            for foundation in FOUNDATIONS:
                 foundation_summary = {}
                 if foundation in prob_scores:
                     foundation_summary['probability'] = prob_scores[foundation]
-                    foundation_summary['strength'] = self._categorize_score(prob_scores[foundation])
+                    foundation_summary['strength'] = strengths[foundation]
                 
                 if foundation in sent_scores:
                     foundation_summary['sentiment'] = sent_scores[foundation]
@@ -334,17 +621,13 @@ class MoralFrameworkAnalyzer:
         
         elif dict_type in ['mfd', 'mfd2']:
             # Handle MFD and MFD2 results
-            foundations = ['care.virtue', 'fairness.virtue', 'loyalty.virtue',
-                          'authority.virtue', 'sanctity.virtue',
-                          'care.vice', 'fairness.vice', 'loyalty.vice',
-                          'authority.vice', 'sanctity.vice']
-            
-            for foundation in foundations:
-                if foundation in scores:
-                    summary['moral_foundations'][foundation] = {
-                        'score': scores[foundation],
-                        'strength': self._categorize_score(scores[foundation])
-                    }
+            present = [foundation for foundation in MFD_KEYS if foundation in scores]
+            strengths = self._categorize_scores([scores[foundation] for foundation in present])
+            for foundation, strength in zip(present, strengths):
+                summary['moral_foundations'][foundation] = {
+                    'score': scores[foundation],
+                    'strength': strength
+                }
             
             if 'moral_nonmoral_ratio' in scores:
                 summary['moral_density'] = {
@@ -356,16 +639,17 @@ class MoralFrameworkAnalyzer:
     
     def _categorize_score(self, score: float) -> str:
         """Categorize a score into strength levels."""
-        if score >= 0.15:
-            return 'very_high'
-        elif score >= 0.10:
-            return 'high'
-        elif score >= 0.05:
-            return 'moderate'
-        elif score >= 0.01:
-            return 'low'
-        else:
-            return 'very_low'
+        return self._categorize_scores([score])[0]
+    
+    def _categorize_scores(self, scores: Union[List[float], 'np.ndarray']) -> List[str]:
+        """Categorize several scores into strength levels in a single vectorized pass."""
+        import numpy as np
+        
+        values = np.asarray(scores, dtype=np.float64)
+        # NaN fails every threshold comparison, so it maps to the lowest level
+        values = np.where(np.isnan(values), -np.inf, values)
+        codes = np.searchsorted(_STRENGTH_THRESHOLDS, values, side='right')
+        return [_STRENGTH_LEVELS[code] for code in codes]
     
     def _interpret_moral_density(self, ratio: float) -> str:
         """Interpret the moral-to-nonmoral word ratio."""
@@ -381,28 +665,30 @@ class MoralFrameworkAnalyzer:
             return 'very_low_moral_content'
 
 
+@functools.lru_cache(maxsize=1)
+def _default_analyzer() -> MoralFrameworkAnalyzer:
+    """Return the process-wide analyzer shared by the convenience functions."""
+    return MoralFrameworkAnalyzer()
+
+
 # Convenience functions for simple use cases
 def analyze_file_moral_framework(file_path: str, **kwargs) -> Dict[str, Any]:
     """Analyze moral frameworks in a file (convenience function)."""
-    analyzer = MoralFrameworkAnalyzer()
-    return analyzer.analyze_file(file_path, **kwargs)
+    return _default_analyzer().analyze_file(file_path, **kwargs)
 
 
 def analyze_file_moral_framework_with_summary(file_path: str, **kwargs) -> Dict[str, Any]:
     """Analyze moral frameworks in a file with summary (convenience function).
     This function includes the moral_summary to avoid KeyError issues."""
-    analyzer = MoralFrameworkAnalyzer()
-    return analyzer.analyze_file_with_summary(file_path, **kwargs)
+    return _default_analyzer().analyze_file_with_summary(file_path, **kwargs)
 
 
 def analyze_text_moral_framework_with_summary(text: str, **kwargs) -> Dict[str, Any]:
     """Analyze moral frameworks in text with summary (convenience function).
     This function includes the moral_summary to avoid KeyError issues."""
-    analyzer = MoralFrameworkAnalyzer()
-    return analyzer.analyze_text_with_summary(text, **kwargs)
+    return _default_analyzer().analyze_text_with_summary(text, **kwargs)
 
 
 def analyze_text_moral_framework(text: str, **kwargs) -> Dict[str, Any]:
     """Analyze moral frameworks in text (convenience function)."""
-    analyzer = MoralFrameworkAnalyzer()
-    return analyzer.analyze_text(text, **kwargs)
\ No newline at end of file
+    return _default_analyzer().analyze_text(text, **kwargs)
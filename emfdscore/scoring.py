@@ -8,8 +8,10 @@ from spacy.language import Language
 from spacy.tokens import Doc
 import warnings
 warnings.simplefilter(action='ignore', category=FutureWarning)
+import numpy as np
 import pandas as pd
 from collections import Counter
+from functools import lru_cache
 from emfdscore.load_mfds import *
 import progressbar
 
@@ -183,6 +185,47 @@ def score_mfd2(doc):
     doc._.score_mfd2 = mfd2_score
     return doc
 
+# Scoring pipes by name, so they can also be applied to an already tokenized Doc
+SCORING_COMPONENTS = {
+    "score_emfd_all_sent": score_emfd_all_sent,
+    "score_emfd_single_sent": score_emfd_single_sent,
+    "score_emfd_all_vice_virtue": score_emfd_all_vice_virtue,
+    "score_emfd_single_vice_virtue": score_emfd_single_vice_virtue,
+    "score_mfd": score_mfd,
+    "score_mfd2": score_mfd2,
+}
+
+
+def _scoring_component(dic_type, prob_map, out_metrics):
+    # Name of the scoring pipe for a dictionary configuration, or None if invalid
+    if dic_type == 'emfd':
+        if prob_map == 'all' and out_metrics == 'sentiment':
+            return "score_emfd_all_sent"
+        elif prob_map == 'single' and out_metrics == 'sentiment':
+            return "score_emfd_single_sent"
+        elif prob_map == 'all' and out_metrics == 'vice-virtue':
+            return "score_emfd_all_vice_virtue"
+        elif prob_map == 'single' and out_metrics == 'vice-virtue':
+            return "score_emfd_single_vice_virtue"
+        print("Invalid emfd configuration for prob_map/out_metrics")
+        return None
+    elif dic_type == 'mfd':
+        return "score_mfd"
+    elif dic_type == 'mfd2':
+        return "score_mfd2"
+    print('Dictionary type not recognized. Available values are: emfd, mfd, mfd2')
+    return None
+
+@lru_cache(maxsize=None)
+def _load_scoring_pipeline(component=None):
+    # Loading the spaCy model dominates short scoring calls, so build each pipeline once.
+    # Without a component the pipeline only tokenizes.
+    nlp = spacy.load('en_core_web_sm', disable=['ner', 'parser'])
+    nlp.add_pipe("mfd_tokenizer")
+    if component is not None:
+        nlp.add_pipe(component, last=True)
+    return nlp
+
 
 def score_docs(csv, dic_type, prob_map, score_type, out_metrics, num_docs):
 
@@ -239,28 +282,10 @@ def score_docs(csv, dic_type, prob_map, score_type, out_metrics, num_docs):
             df = df[['cnt'] + probabilites + senti]
             return df
 
-    nlp = spacy.load('en_core_web_sm', disable=['ner', 'parser'])
-    nlp.add_pipe("mfd_tokenizer")
-
-    if dic_type == 'emfd':
-        if prob_map == 'all' and out_metrics == 'sentiment':
-            nlp.add_pipe("score_emfd_all_sent", last=True)
-        elif prob_map == 'single' and out_metrics == 'sentiment':
-            nlp.add_pipe("score_emfd_single_sent", last=True)
-        elif prob_map == 'all' and out_metrics == 'vice-virtue':
-            nlp.add_pipe("score_emfd_all_vice_virtue", last=True)
-        elif prob_map == 'single' and out_metrics == 'vice-virtue':
-            nlp.add_pipe("score_emfd_single_vice_virtue", last=True)
-        else:
-            print("Invalid emfd configuration for prob_map/out_metrics")
-            return
-    elif dic_type == 'mfd':
-        nlp.add_pipe("score_mfd", last=True)
-    elif dic_type == 'mfd2':
-        nlp.add_pipe("score_mfd2", last=True)
-    else:
-        print('Dictionary type not recognized. Available values are: emfd, mfd, mfd2')
+    component = _scoring_component(dic_type, prob_map, out_metrics)
+    if component is None:
         return
+    nlp = _load_scoring_pipeline(component)
 
     scored_docs = []
     widgets = ['Processed: ', progressbar.Counter(), ' ', progressbar.Percentage(),
@@ -269,23 +294,19 @@ def score_docs(csv, dic_type, prob_map, score_type, out_metrics, num_docs):
     with progressbar.ProgressBar(max_value=num_docs, widgets=widgets) as bar:
         for i, (_, row) in enumerate(_first_text_column(csv).items(), start=1):
             doc = nlp(row)
-            if dic_type == 'emfd':
-                if prob_map == 'all' and out_metrics == 'sentiment':
-                    scored_docs.append(doc._.score_emfd_all_sent)
-                elif prob_map == 'single' and out_metrics == 'sentiment':
-                    scored_docs.append(doc._.score_emfd_single_sent)
-                elif prob_map == 'all' and out_metrics == 'vice-virtue':
-                    scored_docs.append(doc._.score_emfd_all_vice_virtue)
-                elif prob_map == 'single' and out_metrics == 'vice-virtue':
-                    scored_docs.append(doc._.score_emfd_single_vice_virtue)
-            elif dic_type == 'mfd':
-                scored_docs.append(doc._.score_mfd)
-            elif dic_type == 'mfd2':
-                scored_docs.append(doc._.score_mfd2)
+            # Each scoring pipe stores its result in the Doc extension of the same name
+            scored_docs.append(getattr(doc._, component))
             bar.update(i)
 
     df = pd.DataFrame(scored_docs)
+    return _add_variance(df, dic_type, out_metrics)
 
+VICE_VIRTUE_COLUMNS = ['care.virtue', 'fairness.virtue', 'loyalty.virtue',
+                       'authority.virtue', 'sanctity.virtue',
+                       'care.vice', 'fairness.vice', 'loyalty.vice',
+                       'authority.vice', 'sanctity.vice']
+
+def _add_variance(df, dic_type, out_metrics):
     # Retain original variance calculations
     if dic_type == 'emfd':
         if out_metrics == 'sentiment':  # both 'all' and 'single'
@@ -294,26 +315,94 @@ def score_docs(csv, dic_type, prob_map, score_type, out_metrics, num_docs):
             if all(c in df.columns for c in senti):
                 df['sent_var'] = df[senti].var(axis=1)
         elif out_metrics == 'vice-virtue':
-            vv_cols = ['care.virtue', 'fairness.virtue', 'loyalty.virtue',
-                       'authority.virtue', 'sanctity.virtue',
-                       'care.vice', 'fairness.vice', 'loyalty.vice',
-                       'authority.vice', 'sanctity.vice']
-            vv_present = [c for c in vv_cols if c in df.columns]
+            vv_present = [c for c in VICE_VIRTUE_COLUMNS if c in df.columns]
             if vv_present:
                 df['f_var'] = df[vv_present].var(axis=1)
             if 'moral' in df.columns:
                 del df['moral']
     elif dic_type in ['mfd', 'mfd2']:
-        vv_cols = ['care.virtue', 'fairness.virtue', 'loyalty.virtue',
-                   'authority.virtue', 'sanctity.virtue',
-                   'care.vice', 'fairness.vice', 'loyalty.vice',
-                   'authority.vice', 'sanctity.vice']
-        vv_present = [c for c in vv_cols if c in df.columns]
+        vv_present = [c for c in VICE_VIRTUE_COLUMNS if c in df.columns]
         if vv_present:
             df['f_var'] = df[vv_present].var(axis=1)
 
     return df
 
+def _sample_variance(values):
+    # Same as pandas' default var (ddof=1) for a single row, computed the way
+    # pandas does (two-pass over float64) so that the results match bit for bit
+    if len(values) < 2:
+        return float('nan')
+    values = np.asarray(values, dtype=np.float64)
+    mean = values.sum() / len(values)
+    return float(((mean - values) ** 2).sum() / (len(values) - 1))
+
+def _add_variance_single(scores, dic_type, out_metrics):
+    # Dict counterpart of _add_variance for one scored document
+    if dic_type == 'emfd':
+        if out_metrics == 'sentiment':
+            if all(c in scores for c in probabilites):
+                scores['f_var'] = _sample_variance([scores[c] for c in probabilites])
+            if all(c in scores for c in senti):
+                scores['sent_var'] = _sample_variance([scores[c] for c in senti])
+        elif out_metrics == 'vice-virtue':
+            vv_present = [c for c in VICE_VIRTUE_COLUMNS if c in scores]
+            if vv_present:
+                scores['f_var'] = _sample_variance([scores[c] for c in vv_present])
+            scores.pop('moral', None)
+    elif dic_type in ['mfd', 'mfd2']:
+        vv_present = [c for c in VICE_VIRTUE_COLUMNS if c in scores]
+        if vv_present:
+            scores['f_var'] = _sample_variance([scores[c] for c in vv_present])
+    return scores
+
+def score_docs_single(text, dic_type, prob_map, out_metrics):
+    # Score one document like score_docs, but without the DataFrame wrapper or
+    # progress bar. Returns a dict of float scores, or None for an invalid configuration.
+    component = _scoring_component(dic_type, prob_map, out_metrics)
+    if component is None:
+        return
+    doc = _load_scoring_pipeline(component)(text)
+    scores = {k: float(v) for k, v in getattr(doc._, component).items()}
+    return _add_variance_single(scores, dic_type, out_metrics)
+
+def zero_scores(dic_type, prob_map, out_metrics):
+    # Scores of a document without any moral words, exactly as score_docs_single
+    # returns them for such a document. Returns None for an invalid configuration.
+    if _scoring_component(dic_type, prob_map, out_metrics) is None:
+        return
+    return dict(_zero_scores(dic_type, prob_map, out_metrics))
+
+@lru_cache(maxsize=None)
+def _zero_scores(dic_type, prob_map, out_metrics):
+    # Scoring an empty document once per configuration yields the zeroed scores
+    return tuple(score_docs_single('', dic_type, prob_map, out_metrics).items())
+
+def score_docs_multi(csv, dic_types, prob_map, out_metrics, num_docs):
+    # Tokenize every document once and score the same tokens against several
+    # dictionaries. Returns {dic_type: DataFrame} like score_docs would per type.
+    components = {}
+    for dic_type in dic_types:
+        component = _scoring_component(dic_type, prob_map, out_metrics)
+        if component is None:
+            return
+        components[dic_type] = component
+    nlp = _load_scoring_pipeline()
+
+    scored_docs = {dic_type: [] for dic_type in components}
+    widgets = ['Processed: ', progressbar.Counter(), ' ', progressbar.Percentage(),
+               ' ', progressbar.Bar(marker="❤"), ' ', progressbar.Timer(), ' ', progressbar.ETA()]
+
+    with progressbar.ProgressBar(max_value=num_docs, widgets=widgets) as bar:
+        for i, (_, row) in enumerate(_first_text_column(csv).items(), start=1):
+            doc = nlp(row)
+            for dic_type, component in components.items():
+                SCORING_COMPONENTS[component](doc)
+                scored_docs[dic_type].append(getattr(doc._, component))
+            bar.update(i)
+
+    return {dic_type: _add_variance(pd.DataFrame(docs), dic_type, out_metrics)
+            for dic_type, docs in scored_docs.items()}
+
 def find_ent(token, entities):
     for k, v in entities.items():
         if token in v:
@@ -4,8 +4,18 @@ This module provides an extensible interface for extracting text from different
 """
 
 import abc
+import codecs
+import functools
+import hashlib
+import io
+import itertools
+import multiprocessing
 import os
-from typing import List, Optional, Dict, Any
+import re
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, List, Optional, Dict, Any, TextIO, Tuple, Union
 import logging
 
 # PDF processing imports
@@ -21,21 +31,334 @@ try:
 except ImportError:
     PYPDF2_AVAILABLE = False
 
+# PyMuPDF (optional) gives fast plain-text extraction and renders pages for OCR.
+# Newer releases print a deprecation notice to stdout on `import fitz`, so prefer
+# the `pymupdf` module name and fall back to `fitz` for releases before 1.24.3.
+try:
+    import pymupdf as fitz
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    try:
+        import fitz
+        PYMUPDF_AVAILABLE = True
+    except ImportError:
+        PYMUPDF_AVAILABLE = False
+
 # OCR imports (optional)
 try:
     import pytesseract
-    from PIL import Image
-    import io
-    OCR_AVAILABLE = True
+    PYTESSERACT_AVAILABLE = True
+except ImportError:
+    PYTESSERACT_AVAILABLE = False
+
+# tesserocr (optional) keeps the tesseract engine loaded in-process
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+try:
+    from PIL import Image, ImageOps
+    OCR_AVAILABLE = PYTESSERACT_AVAILABLE or TESSEROCR_AVAILABLE
 except ImportError:
     OCR_AVAILABLE = False
 
+# charset-normalizer (optional, installed with pdfminer.six) detects unknown text encodings
+try:
+    import charset_normalizer
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:
+    CHARSET_NORMALIZER_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Plain text reading: encoding sample size, read buffer size and fallback encodings
+TEXT_SAMPLE_SIZE = 64 * 1024
+TEXT_BUFFER_SIZE = 1 << 20
+TEXT_FALLBACK_ENCODINGS = ('latin-1', 'cp1252', 'iso-8859-1')
+
+# Byte order marks and their encodings, UTF-32 first since its LE mark starts like UTF-16's
+TEXT_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Read size used when hashing files for the OCR cache
+HASH_CHUNK_SIZE = 1 << 20
+
+# extract_many: files larger than this skip the file pool and use page-level parallelism
+EXTRACT_MANY_LARGE_FILE_SIZE = 10 * 1024 * 1024
+
+# Page-parallel PDF extraction and OCR settings
+PDF_MAX_WORKERS = 6
+PDF_MIN_PAGES_FOR_POOL = 4
+PDF_PAGES_PER_TASK = 10
+OCR_MAX_WORKERS = 5
+
+# Scanned PDF detection: a text layer with fewer visible characters than this counts as empty
+SCANNED_MIN_CHARS = 50
+_VISIBLE_CHAR_RE = re.compile(r'\S')
+
+# OCR page rendering: target resolution, size cap and margin kept around the content
+OCR_DPI = 200
+OCR_MAX_DIMENSION = 1280
+OCR_CROP_MARGIN = 10
+
+# Deskew search: angles tried in both directions, step between them and sample size
+OCR_DESKEW_MAX_ANGLE = 5.0
+OCR_DESKEW_STEP = 0.5
+OCR_DESKEW_SAMPLE_SIZE = 600
+
+
+# Persistent tesserocr engines, one per thread and language
+_tesseract_apis = threading.local()
+
+# PyMuPDF does not support use from several threads at once, and batch analysis
+# extracts files in a thread pool, so every PyMuPDF call in this module holds this lock
+_FITZ_LOCK = threading.RLock()
+
+
+def _reset_fitz_lock():
+    """Give a forked child a fresh lock, in case another thread held it at fork time."""
+    global _FITZ_LOCK
+    _FITZ_LOCK = threading.RLock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_fitz_lock)
+
+
+def _get_tesseract_api(lang: str) -> 'tesserocr.PyTessBaseAPI':
+    """Return this thread's tesserocr engine for a language, loading it on first use."""
+    apis = getattr(_tesseract_apis, 'by_lang', None)
+    if apis is None:
+        apis = _tesseract_apis.by_lang = {}
+    if lang not in apis:
+        apis[lang] = tesserocr.PyTessBaseAPI(lang=lang)
+    return apis[lang]
+
+
+def _ocr_image(img: 'Image.Image', lang: str = 'eng', psm: Optional[int] = None) -> str:
+    """OCR one image, in-process with tesserocr if available, otherwise with pytesseract."""
+    if TESSEROCR_AVAILABLE:
+        # Reusing the engine avoids a tesseract process start and model load per page
+        api = _get_tesseract_api(lang)
+        api.SetPageSegMode(psm if psm is not None else tesserocr.PSM.AUTO)
+        api.SetImage(img)
+        return api.GetUTF8Text()
+    
+    config = f'--psm {psm}' if psm is not None else ''
+    return pytesseract.image_to_string(img, lang=lang, config=config)
+
+
+def _render_page(page) -> 'Image.Image':
+    """Render a PyMuPDF page as a grayscale image for OCR, sized for tesseract and cropped to its content."""
+    # Render straight at the target size: OCR_DPI, but no side longer than OCR_MAX_DIMENSION
+    zoom = min(OCR_DPI / 72, OCR_MAX_DIMENSION / max(page.rect.width, page.rect.height))
+    # OCR only needs luminance, so render grayscale and wrap the raw samples
+    # directly rather than round-tripping through a PNG encode and decode
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False)
+    img = Image.frombuffer('L', (pix.width, pix.height), pix.samples, 'raw', 'L', pix.stride, 1)
+    
+    # Tesseract time grows with pixel count, so drop the blank margins around the content
+    bbox = ImageOps.invert(img).getbbox()
+    if bbox:
+        left, top, right, bottom = bbox
+        img = img.crop((max(left - OCR_CROP_MARGIN, 0), max(top - OCR_CROP_MARGIN, 0),
+                        min(right + OCR_CROP_MARGIN, img.width), min(bottom + OCR_CROP_MARGIN, img.height)))
+    return img
+
+
+def _otsu_threshold(gray: 'Image.Image') -> int:
+    """Return the Otsu binarization threshold of a grayscale image."""
+    histogram = gray.histogram()
+    total = sum(histogram)
+    weighted_total = sum(value * count for value, count in enumerate(histogram))
+    
+    best_threshold, best_variance = 0, -1.0
+    background_count, background_sum = 0, 0
+    for value, count in enumerate(histogram):
+        background_count += count
+        foreground_count = total - background_count
+        if background_count == 0:
+            continue
+        if foreground_count == 0:
+            break
+        background_sum += value * count
+        background_mean = background_sum / background_count
+        foreground_mean = (weighted_total - background_sum) / foreground_count
+        variance = background_count * foreground_count * (background_mean - foreground_mean) ** 2
+        if variance > best_variance:
+            best_threshold, best_variance = value, variance
+    return best_threshold
+
+
+def _estimate_skew(binary: 'Image.Image') -> float:
+    """Estimate the rotation (degrees) that makes the text lines of a binarized page horizontal."""
+    import numpy as np
+    
+    # Text lines give the sharpest row-by-row ink profile once they are level
+    ink = ImageOps.invert(binary)
+    ink.thumbnail((OCR_DESKEW_SAMPLE_SIZE, OCR_DESKEW_SAMPLE_SIZE))
+    steps = int(OCR_DESKEW_MAX_ANGLE / OCR_DESKEW_STEP)
+    best_angle, best_score = 0.0, -1.0
+    for step in range(-steps, steps + 1):
+        angle = step * OCR_DESKEW_STEP
+        rows = np.asarray(ink.rotate(angle, expand=True), dtype=np.float64).sum(axis=1)
+        score = float(np.sum(np.diff(rows) ** 2))
+        if score > best_score:
+            best_angle, best_score = angle, score
+    return best_angle
+
+
+def _preprocess_for_ocr(img: 'Image.Image') -> 'Image.Image':
+    """Turn a rendered page into a deskewed 1-bit image for tesseract."""
+    gray = img.convert('L')
+    threshold = _otsu_threshold(gray)
+    lut = [0] * (threshold + 1) + [255] * (255 - threshold)
+    
+    angle = _estimate_skew(gray.point(lut))
+    if angle:
+        gray = gray.rotate(angle, resample=Image.BILINEAR, expand=True, fillcolor=255)
+    return gray.point(lut, mode='1')
+
+
+def _ocr_page(file_path: str, page_num: int, lang: str = 'eng', psm: Optional[int] = 6) -> str:
+    """Render one PDF page and OCR it (runs in a worker process)."""
+    with _FITZ_LOCK, fitz.open(file_path) as pdf_document:
+        img = _render_page(pdf_document[page_num])
+    return _ocr_image(_preprocess_for_ocr(img), lang, psm)
+
+
+def _map_pdf_pages(file_path: str, pages: Optional[List[int]], page_fn: Callable) -> Iterator[Any]:
+    """Yield page_fn(page) for the given 1-based PDF pages (default: all), using PyMuPDF.
+    
+    _FITZ_LOCK is held while opening, per page and while closing, but not while
+    the caller handles each result, so other threads can use PyMuPDF in between.
+    """
+    with _FITZ_LOCK:
+        pdf_document = fitz.open(file_path)
+        page_nums = pages if pages is not None else range(1, pdf_document.page_count + 1)
+    try:
+        for page_num in page_nums:
+            with _FITZ_LOCK:
+                result = page_fn(pdf_document[page_num - 1])
+            yield result
+    finally:
+        with _FITZ_LOCK:
+            pdf_document.close()
+
+
+def _render_pages_for_ocr(file_path: str) -> List['Image.Image']:
+    """Render and preprocess every page of a PDF for OCR in this process."""
+    return [_preprocess_for_ocr(img) for img in _map_pdf_pages(file_path, None, _render_page)]
+
+
+def _ocr_images_batch(images: List['Image.Image'], lang: str = 'eng', psm: Optional[int] = None) -> List[str]:
+    """OCR several images with one tesseract run over a multi-page TIFF (pytesseract).
+    
+    Tesseract loads its language model once for the whole file instead of once
+    per page, and ends each page's text with a form feed.
+    """
+    fd, tiff_path = tempfile.mkstemp(suffix='.tif')
+    os.close(fd)
+    try:
+        images[0].save(tiff_path, format='TIFF', save_all=True, append_images=images[1:])
+        config = f'--psm {psm}' if psm is not None else ''
+        output = pytesseract.image_to_string(tiff_path, lang=lang, config=config)
+    finally:
+        os.unlink(tiff_path)
+    
+    page_texts = output.split('\x0c')
+    if len(page_texts) == len(images) + 1 and not page_texts[-1].strip():
+        page_texts.pop()
+    if len(page_texts) != len(images):
+        raise ValueError(f"Expected {len(images)} pages of OCR output, got {len(page_texts)}")
+    return page_texts
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_pdf(file_path: str, mtime_ns: int) -> Tuple[int, Dict[str, Any]]:
+    """Return a PDF's page count and document info, cached per path and modification time.
+    
+    PyPDF2 only needs the trailer and page tree for this, which is cheaper than
+    a full pdfplumber open. Keys are returned without the leading '/'.
+    """
+    if PYPDF2_AVAILABLE:
+        try:
+            reader = PdfReader(file_path)
+            info = {key.lstrip('/'): str(value) for key, value in (reader.metadata or {}).items()}
+            return len(reader.pages), info
+        except Exception as e:
+            logger.debug(f"PyPDF2 could not probe {file_path}: {e}")
+    
+    if PDF_AVAILABLE:
+        try:
+            with pdfplumber.open(file_path) as pdf:
+                return len(pdf.pages), dict(pdf.metadata or {})
+        except Exception as e:
+            logger.debug(f"pdfplumber could not probe {file_path}: {e}")
+    
+    if PYMUPDF_AVAILABLE:
+        with _FITZ_LOCK, fitz.open(file_path) as pdf_document:
+            # PyMuPDF uses lowercase keys ('title', 'modDate') and adds non-info entries
+            info = {key[:1].upper() + key[1:]: value
+                    for key, value in (pdf_document.metadata or {}).items()
+                    if value and key not in ('format', 'encryption')}
+            return pdf_document.page_count, info
+    
+    raise ValueError(f"Unable to read PDF structure: {file_path}")
+
+
+def _join_pages(page_texts: Iterable[Optional[str]]) -> Tuple[str, bool]:
+    """Join non-empty page texts with newlines, noting whether any page has non-whitespace text."""
+    text_parts = []
+    has_content = False
+    for page_text in page_texts:
+        if page_text:
+            text_parts.append(page_text)
+            # isspace() stops at the first visible character, unlike strip()
+            has_content = has_content or not page_text.isspace()
+    return '\n'.join(text_parts), has_content
+
+
+def _stat_path(file_path: Union[str, os.DirEntry]) -> Tuple[str, os.stat_result]:
+    """Return a file's path and stat, reusing the stat cached on an os.scandir() entry."""
+    if isinstance(file_path, os.DirEntry):
+        return file_path.path, file_path.stat()
+    return file_path, os.stat(file_path)
+
+
+@functools.lru_cache(maxsize=256)
+def _hash_file(file_path: str, size: int, mtime_ns: int) -> str:
+    """Return the BLAKE2b hex digest of a file's contents, read in 1 MB chunks.
+    
+    Cached per path, size and modification time, so unchanged files are not hashed again.
+    """
+    digest = hashlib.blake2b()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _extract_pdfplumber_pages(file_path: str, start: int, stop: int) -> List[Optional[str]]:
+    """Extract the text of pages [start, stop) with pdfplumber (runs in a worker process)."""
+    with pdfplumber.open(file_path, pages=range(start + 1, stop + 1)) as pdf:
+        return [page.extract_text() for page in pdf.pages]
+
 
 class TextExtractorBase(abc.ABC):
     """Base class for text extractors providing extensible interface."""
     
+    # Lowercase file extensions handled by this extractor, used for dispatch.
+    # Extractors that leave this empty are asked through supports_file instead.
+    extensions: tuple = ()
+    
     @abc.abstractmethod
     def extract(self, file_path: str, **kwargs) -> str:
         """Extract text from the given file."""
@@ -54,60 +377,220 @@ class TextExtractorBase(abc.ABC):
 class TxtExtractor(TextExtractorBase):
     """Text extractor for plain text files."""
     
-    def extract(self, file_path: str, encoding: str = 'utf-8', **kwargs) -> str:
-        """Extract text from a text file."""
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # Try with different encodings
-            for enc in ['latin-1', 'cp1252', 'iso-8859-1']:
+    extensions = ('.txt', '.text')
+    
+    def extract(self, file_path: str, encoding: str = 'utf-8', out: Optional[TextIO] = None, **kwargs) -> str:
+        """Extract text from a text file.
+        
+        The file is opened once. If it does not decode with the requested
+        encoding, the detected encoding and then common fallbacks are tried
+        on the same handle.
+        
+        Args:
+            file_path: Path to the text file
+            encoding: Encoding to try first
+            out: If given, the text is written to this stream chunk by chunk
+                and an empty string is returned
+        """
+        if out is not None:
+            for chunk in self.iter_chunks(file_path, encoding=encoding):
+                out.write(chunk)
+            return ""
+        
+        with open(file_path, 'rb', buffering=TEXT_BUFFER_SIZE) as f:
+            for enc in self._candidate_encodings(f, encoding):
+                f.seek(0)
                 try:
-                    with open(file_path, 'r', encoding=enc) as f:
-                        logger.warning(f"Using encoding {enc} for {file_path}")
-                        return f.read()
+                    text = ''.join(self._decode_stream(f, enc))
                 except UnicodeDecodeError:
                     continue
-            raise ValueError(f"Unable to decode text file {file_path}")
+                if enc != encoding:
+                    logger.warning(f"Using encoding {enc} for {file_path}")
+                return text
+        raise ValueError(f"Unable to decode text file {file_path}")
+    
+    def iter_chunks(self, file_path: str, encoding: str = 'utf-8',
+                    chunk_size: int = TEXT_BUFFER_SIZE) -> Iterator[str]:
+        """Yield the decoded text of a file chunk by chunk, for files too large to hold in memory.
+        
+        The encoding is chosen from a sample at the start of the file; a later
+        part that does not decode raises UnicodeDecodeError.
+        """
+        with open(file_path, 'rb', buffering=TEXT_BUFFER_SIZE) as f:
+            candidates = self._candidate_encodings(f, encoding)
+            if not candidates:
+                raise ValueError(f"Unable to decode text file {file_path}")
+            if candidates[0] != encoding:
+                logger.warning(f"Using encoding {candidates[0]} for {file_path}")
+            f.seek(0)
+            yield from self._decode_stream(f, candidates[0], chunk_size)
+    
+    @staticmethod
+    def _candidate_encodings(f, encoding: str) -> List[str]:
+        """List the encodings worth trying, judged on a sample from the start of the file.
+        
+        Raises LookupError if the requested encoding is unknown; only detected
+        and fallback encodings are skipped when they cannot be used.
+        """
+        codecs.lookup(encoding)
+        sample = f.read(TEXT_SAMPLE_SIZE)
+        final = len(sample) < TEXT_SAMPLE_SIZE
+        
+        # A byte order mark identifies the encoding outright
+        detected = next((enc for bom, enc in TEXT_BOM_ENCODINGS if sample.startswith(bom)), None)
+        if detected is None and CHARSET_NORMALIZER_AVAILABLE:
+            match = charset_normalizer.from_bytes(sample).best()
+            # Guesses between single-byte code pages are unreliable on short texts
+            # (Latin-1 often comes back as cp1250), so only Unicode guesses go ahead
+            # of the fixed fallbacks; those already cover the single-byte case
+            if match is not None and codecs.lookup(match.encoding).name.startswith('utf'):
+                detected = match.encoding
+        
+        candidates, seen = [], set()
+        for enc in (encoding, detected) + TEXT_FALLBACK_ENCODINGS:
+            if enc is None:
+                continue
+            try:
+                name = codecs.lookup(enc).name
+                # An incremental decoder tolerates a multi-byte character cut by the sample
+                codecs.getincrementaldecoder(enc)().decode(sample, final=final)
+            except (LookupError, UnicodeDecodeError):
+                continue
+            if name not in seen:
+                seen.add(name)
+                candidates.append(enc)
+        return candidates
+    
+    @staticmethod
+    def _decode_stream(f, encoding: str, chunk_size: int = TEXT_BUFFER_SIZE) -> Iterator[str]:
+        """Decode a binary file incrementally, translating newlines like text mode does."""
+        decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(), translate=True)
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                break
+            yield decoder.decode(block)
+        yield decoder.decode(b'', final=True)
     
     def supports_file(self, file_path: str) -> bool:
         """Check if file is a text file."""
-        return file_path.lower().endswith(('.txt', '.text'))
+        return file_path.lower().endswith(self.extensions)
     
-    def get_metadata(self, file_path: str) -> Dict[str, Any]:
+    def get_metadata(self, file_path: Union[str, os.DirEntry]) -> Dict[str, Any]:
         """Get basic file metadata."""
-        if os.path.exists(file_path):
-            stat = os.stat(file_path)
-            return {
-                'file_size': stat.st_size,
-                'file_type': 'text',
-                'modified_time': stat.st_mtime
-            }
-        return {}
+        try:
+            _, stat = _stat_path(file_path)
+        except FileNotFoundError:
+            return {}
+        return {
+            'file_size': stat.st_size,
+            'file_type': 'text',
+            'modified_time': stat.st_mtime
+        }
 
 
 class PDFExtractor(TextExtractorBase):
     """Text extractor for PDF files with fallback OCR support."""
     
-    def __init__(self, use_ocr_fallback: bool = True):
+    extensions = ('.pdf',)
+    
+    def __init__(self,
+                 use_ocr_fallback: bool = True,
+                 ocr_lang: str = 'eng',
+                 ocr_psm: Optional[int] = 6,
+                 cache_dir: Optional[str] = None,
+                 ocr_executor: str = 'process'):
         """Initialize PDF extractor.
         
         Args:
             use_ocr_fallback: Whether to use OCR when text extraction fails
+            ocr_lang: Tesseract language(s) used for OCR, e.g. 'eng' or 'eng+deu'
+            ocr_psm: Tesseract page segmentation mode (default: 6, a uniform block
+                of text; None uses tesseract's automatic segmentation)
+            cache_dir: Directory for OCR results keyed by file content hash, so
+                unchanged (or renamed) files are not OCRed again (default: no cache)
+            ocr_executor: 'process' renders and OCRs pages in worker processes;
+                'thread' renders pages here and overlaps only the tesseract calls
+                in threads, avoiding process start-up and pickling; 'batch' runs
+                tesseract once over all pages so its model loads only once
+                (pytesseract only; tesserocr already keeps its engine loaded,
+                so pages are then OCRed as with 'process')
         """
+        if ocr_executor not in ('process', 'thread', 'batch'):
+            raise ValueError(f"ocr_executor must be 'process', 'thread' or 'batch', not {ocr_executor!r}")
         self.use_ocr_fallback = use_ocr_fallback and OCR_AVAILABLE
-        if not PDF_AVAILABLE and not PYPDF2_AVAILABLE:
-            raise ImportError("Neither pdfplumber nor PyPDF2 is available for PDF processing")
+        self.ocr_lang = ocr_lang
+        self.ocr_psm = ocr_psm
+        self.cache_dir = cache_dir
+        self.ocr_executor = ocr_executor
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        if not (PYMUPDF_AVAILABLE or PDF_AVAILABLE or PYPDF2_AVAILABLE):
+            raise ImportError("None of PyMuPDF, pdfplumber or PyPDF2 is available for PDF processing")
     
-    def extract(self, file_path: str, **kwargs) -> str:
-        """Extract text from PDF file."""
-        text = ""
+    def extract(self, file_path: str, num_workers: Optional[int] = None,
+                out: Optional[TextIO] = None, pages: Optional[Iterable[int]] = None, **kwargs) -> str:
+        """Extract text from PDF file.
+        
+        Backends are tried in order until one returns text: PyMuPDF (fastest,
+        no layout analysis), pdfplumber, PyPDF2, then OCR.
+        
+        Args:
+            file_path: Path to the PDF file
+            num_workers: Worker processes for page-parallel extraction and OCR
+                (default: CPU count, at most 6 and 5 respectively; 1 runs sequentially)
+            out: If given, page texts are written to this stream as they are
+                extracted and an empty string is returned
+            pages: 1-based page numbers to extract (default: all pages);
+                a number below 1 raises ValueError
+        """
+        if out is not None or pages is not None:
+            # Page-by-page extraction, so the whole document is never held in memory
+            found = False
+            page_texts = self.iter_pages(file_path, pages)
+            if out is None:
+                text = '\n'.join(page_texts)
+                found = bool(text)
+            else:
+                for page_text in page_texts:
+                    if found:
+                        out.write('\n')
+                    out.write(page_text)
+                    found = True
+                text = ""
+            if not found:
+                raise ValueError(f"Unable to extract text from PDF: {file_path}")
+            return text
+        
+        text, has_content = "", False
+        ocr_tried = False
+        
+        # Try PyMuPDF first: plain text without pdfplumber's per-character layout objects
+        if PYMUPDF_AVAILABLE:
+            try:
+                text, has_content = self._extract_with_pymupdf(file_path)
+            except Exception as e:
+                logger.warning(f"PyMuPDF extraction failed for {file_path}: {e}")
+            else:
+                # PyMuPDF has read the whole text layer. If it holds only a few stray
+                # characters while the pages carry images, the PDF is scanned and the
+                # other text backends would find no more, so OCR it before them.
+                if self.use_ocr_fallback and self._looks_scanned(file_path, text):
+                    ocr_tried = True
+                    try:
+                        ocr_text, ocr_has_content = self._extract_with_ocr(file_path, num_workers)
+                        if ocr_has_content:
+                            return ocr_text
+                    except Exception as e:
+                        logger.warning(f"OCR extraction failed for {file_path}: {e}")
+                if has_content:  # If we got meaningful text
+                    return text
         
-        # Try pdfplumber first (better text extraction)
+        # Then pdfplumber
         if PDF_AVAILABLE:
             try:
-                text = self._extract_with_pdfplumber(file_path)
-                if text.strip():  # If we got meaningful text
+                text, has_content = self._extract_with_pdfplumber(file_path, num_workers)
+                if has_content:  # If we got meaningful text
                     return text
             except Exception as e:
                 logger.warning(f"pdfplumber extraction failed for {file_path}: {e}")
@@ -115,85 +598,234 @@ class PDFExtractor(TextExtractorBase):
         # Fallback to PyPDF2
         if PYPDF2_AVAILABLE:
             try:
-                text = self._extract_with_pypdf2(file_path)
-                if text.strip():  # If we got meaningful text
+                text, has_content = self._extract_with_pypdf2(file_path)
+                if has_content:  # If we got meaningful text
                     return text
             except Exception as e:
                 logger.warning(f"PyPDF2 extraction failed for {file_path}: {e}")
         
         # If no text extracted and OCR is available, try OCR
-        if self.use_ocr_fallback and not text.strip():
+        if self.use_ocr_fallback and not has_content and not ocr_tried:
             try:
-                text = self._extract_with_ocr(file_path)
+                text, has_content = self._extract_with_ocr(file_path, num_workers)
             except Exception as e:
                 logger.warning(f"OCR extraction failed for {file_path}: {e}")
         
-        if not text.strip():
+        if not has_content:
             raise ValueError(f"Unable to extract text from PDF: {file_path}")
         
         return text
     
-    def _extract_with_pdfplumber(self, file_path: str) -> str:
-        """Extract text using pdfplumber."""
-        text_parts = []
-        with pdfplumber.open(file_path) as pdf:
+    def iter_pages(self, file_path: str, pages: Optional[Iterable[int]] = None) -> Iterator[str]:
+        """Yield the text of each page that has any, one page at a time.
+        
+        Backends are tried in the same order as extract; one that yields no
+        text for any page is skipped in favour of the next.
+        
+        Args:
+            file_path: Path to the PDF file
+            pages: 1-based page numbers to read (default: all pages)
+        
+        Raises:
+            ValueError: If a page number is below 1
+        """
+        if pages is not None:
+            pages = list(pages)
+            # Backends index pages as page_num - 1, where 0 or less would wrap to the last pages
+            invalid = [page_num for page_num in pages if page_num < 1]
+            if invalid:
+                raise ValueError(f"Page numbers are 1-based, got {invalid}")
+        
+        backends = []
+        if PYMUPDF_AVAILABLE:
+            backends.append(('PyMuPDF', self._iter_pymupdf_pages))
+        if PDF_AVAILABLE:
+            backends.append(('pdfplumber', self._iter_pdfplumber_pages))
+        if PYPDF2_AVAILABLE:
+            backends.append(('PyPDF2', self._iter_pypdf2_pages))
+        if self.use_ocr_fallback:
+            backends.append(('OCR', self._iter_ocr_pages))
+        
+        for name, iter_backend_pages in backends:
+            found = False
+            try:
+                for page_text in iter_backend_pages(file_path, pages):
+                    if page_text and not page_text.isspace():
+                        found = True
+                        yield page_text
+            except Exception as e:
+                if found:
+                    # Pages were already handed out, so another backend cannot take over
+                    raise
+                logger.warning(f"{name} extraction failed for {file_path}: {e}")
+            if found:
+                return
+    
+    def _iter_pymupdf_pages(self, file_path: str, pages: Optional[List[int]] = None) -> Iterator[str]:
+        """Yield page texts using PyMuPDF."""
+        return _map_pdf_pages(file_path, pages, lambda page: page.get_text("text"))
+    
+    def _iter_pdfplumber_pages(self, file_path: str, pages: Optional[List[int]] = None) -> Iterator[str]:
+        """Yield page texts using pdfplumber."""
+        with pdfplumber.open(file_path, pages=pages) as pdf:
             for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-        return '\n'.join(text_parts)
-    
-    def _extract_with_pypdf2(self, file_path: str) -> str:
-        """Extract text using PyPDF2."""
-        text_parts = []
+                yield page.extract_text()
+    
+    def _iter_pypdf2_pages(self, file_path: str, pages: Optional[List[int]] = None) -> Iterator[str]:
+        """Yield page texts using PyPDF2."""
         with open(file_path, 'rb') as file:
             pdf_reader = PdfReader(file)
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-        return '\n'.join(text_parts)
-    
-    def _extract_with_ocr(self, file_path: str) -> str:
-        """Extract text using OCR (requires tesseract)."""
+            for page_num in (pages if pages is not None else range(1, len(pdf_reader.pages) + 1)):
+                yield pdf_reader.pages[page_num - 1].extract_text()
+    
+    def _iter_ocr_pages(self, file_path: str, pages: Optional[List[int]] = None) -> Iterator[str]:
+        """Yield page texts using OCR, one page at a time."""
+        if not PYMUPDF_AVAILABLE:
+            raise ImportError("PyMuPDF is required to render PDF pages for OCR")
+        for img in _map_pdf_pages(file_path, pages, _render_page):
+            yield _ocr_image(_preprocess_for_ocr(img), self.ocr_lang, self.ocr_psm)
+    
+    @staticmethod
+    def _looks_scanned(file_path: str, text: str) -> bool:
+        """Check whether a PDF's whole text layer is (nearly) empty while its pages carry images."""
+        # Counting stops at the threshold, so documents with real text cost almost nothing
+        visible_chars = sum(1 for _ in itertools.islice(_VISIBLE_CHAR_RE.finditer(text), SCANNED_MIN_CHARS))
+        if visible_chars >= SCANNED_MIN_CHARS:
+            return False
+        try:
+            with _FITZ_LOCK, fitz.open(file_path) as pdf_document:
+                return any(page.get_images() for page in pdf_document)
+        except Exception as e:
+            logger.debug(f"Could not check {file_path} for images: {e}")
+            return False
+    
+    @staticmethod
+    def _probe(file_path: str) -> Tuple[int, Dict[str, Any]]:
+        """Return the cached page count and document info for a PDF."""
+        return _probe_pdf(os.path.abspath(file_path), os.stat(file_path).st_mtime_ns)
+    
+    def _extract_with_pymupdf(self, file_path: str) -> Tuple[str, bool]:
+        """Extract text using PyMuPDF, returning the text and whether it has any content."""
+        return _join_pages(self._iter_pymupdf_pages(file_path))
+    
+    def _extract_with_pdfplumber(self, file_path: str, num_workers: Optional[int] = None) -> Tuple[str, bool]:
+        """Extract text using pdfplumber, spreading larger documents over worker processes.
+        
+        Returns the text and whether it has any content.
+        """
+        if num_workers is None:
+            num_workers = min(os.cpu_count() or 1, PDF_MAX_WORKERS)
+        
+        page_count = self._probe(file_path)[0]
+        if num_workers <= 1 or page_count < PDF_MIN_PAGES_FOR_POOL:
+            with pdfplumber.open(file_path) as pdf:
+                return _join_pages(page.extract_text() for page in pdf.pages)
+        
+        # pdfminer parsing is CPU-bound, so pages are parsed in separate processes.
+        # Each task reopens the PDF, so pages are grouped to amortize that cost.
+        pages_per_task = min(PDF_PAGES_PER_TASK, -(-page_count // num_workers))
+        starts = range(0, page_count, pages_per_task)
+        stops = [min(start + pages_per_task, page_count) for start in starts]
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(starts))) as executor:
+            task_results = executor.map(_extract_pdfplumber_pages, itertools.repeat(file_path), starts, stops)
+            return _join_pages(itertools.chain.from_iterable(task_results))
+    
+    def _extract_with_pypdf2(self, file_path: str) -> Tuple[str, bool]:
+        """Extract text using PyPDF2, returning the text and whether it has any content."""
+        return _join_pages(self._iter_pypdf2_pages(file_path))
+    
+    def _extract_with_ocr(self, file_path: str, num_workers: Optional[int] = None) -> Tuple[str, bool]:
+        """Extract text using OCR (requires tesseract), reusing cached results when cache_dir is set.
+        
+        Returns the text and whether it has any content. Blank pages are dropped
+        from OCR output, so any text at all counts as content.
+        """
+        text = self._cached_ocr(file_path, num_workers) if self.cache_dir else self._run_ocr(file_path, num_workers)
+        return text, bool(text)
+    
+    def _cached_ocr(self, file_path: str, num_workers: Optional[int] = None) -> str:
+        """Return OCR text from the on-disk cache, running OCR and storing it on a miss."""
+        cache_path = self._ocr_cache_path(file_path)
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
+        
+        text = self._run_ocr(file_path, num_workers)
+        tmp_path = None
+        try:
+            # Write to a temporary file first so readers never see a partial result
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write OCR cache for {file_path}: {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
+        return text
+    
+    def _ocr_cache_path(self, file_path: str) -> str:
+        """Return the cache file for a PDF's OCR text under the current OCR settings."""
+        stat = os.stat(file_path)
+        file_hash = _hash_file(os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        return os.path.join(self.cache_dir, f"{file_hash}-{self.ocr_lang}-{self.ocr_psm}.txt")
+    
+    def _run_ocr(self, file_path: str, num_workers: Optional[int] = None) -> str:
+        """OCR every page of a PDF."""
         if not OCR_AVAILABLE:
             raise ImportError("OCR dependencies not available")
         
-        # Convert PDF pages to images and OCR them
-        text_parts = []
-        try:
-            import fitz  # PyMuPDF for converting PDF to images
-            pdf_document = fitz.open(file_path)
-            for page_num in range(pdf_document.page_count):
-                page = pdf_document[page_num]
-                pix = page.get_pixmap()
-                img_data = pix.tobytes("png")
-                img = Image.open(io.BytesIO(img_data))
-                
-                # Perform OCR
-                page_text = pytesseract.image_to_string(img)
-                if page_text.strip():
-                    text_parts.append(page_text)
-            
-            pdf_document.close()
-        except ImportError:
+        if not PYMUPDF_AVAILABLE:
             logger.warning("PyMuPDF not available, OCR extraction may be limited")
-            raise
+            raise ImportError("PyMuPDF is required to render PDF pages for OCR")
+        
+        page_count = self._probe(file_path)[0]
         
-        return '\n'.join(text_parts)
+        if num_workers is None:
+            num_workers = min(os.cpu_count() or 1, OCR_MAX_WORKERS)
+        
+        if self.ocr_executor == 'batch' and not TESSEROCR_AVAILABLE and page_count > 1:
+            try:
+                page_texts = _ocr_images_batch(_render_pages_for_ocr(file_path), self.ocr_lang, self.ocr_psm)
+                return '\n'.join(page_text for page_text in page_texts if page_text.strip())
+            except Exception as e:
+                logger.warning(f"Batch OCR failed for {file_path}, falling back to per-page OCR: {e}")
+        
+        # Pages are independent and tesseract dominates the runtime, so OCR them in parallel
+        page_args = [(file_path, page_num, self.ocr_lang, self.ocr_psm) for page_num in range(page_count)]
+        if num_workers <= 1 or page_count < 2:
+            page_texts = [_ocr_page(*args) for args in page_args]
+        elif self.ocr_executor == 'thread':
+            # Tesseract runs outside the GIL (a subprocess for pytesseract, native code
+            # for tesserocr), so threads overlap it without shipping images between processes
+            images = _render_pages_for_ocr(file_path)
+            with ThreadPoolExecutor(max_workers=min(num_workers, page_count)) as executor:
+                page_texts = list(executor.map(_ocr_image, images, itertools.repeat(self.ocr_lang),
+                                               itertools.repeat(self.ocr_psm)))
+        else:
+            with multiprocessing.Pool(processes=min(num_workers, page_count)) as pool:
+                page_texts = pool.starmap(_ocr_page, page_args)
+        
+        return '\n'.join(page_text for page_text in page_texts if page_text.strip())
     
     def supports_file(self, file_path: str) -> bool:
         """Check if file is a PDF."""
-        return file_path.lower().endswith('.pdf')
+        return file_path.lower().endswith(self.extensions)
     
-    def get_metadata(self, file_path: str) -> Dict[str, Any]:
+    def get_metadata(self, file_path: Union[str, os.DirEntry]) -> Dict[str, Any]:
         """Get PDF metadata."""
         metadata = {}
-        if not os.path.exists(file_path):
+        try:
+            file_path, stat = _stat_path(file_path)
+        except FileNotFoundError:
             return metadata
         
         # Basic file info
-        stat = os.stat(file_path)
         metadata.update({
             'file_size': stat.st_size,
             'file_type': 'pdf',
@@ -201,15 +833,14 @@ class PDFExtractor(TextExtractorBase):
         })
         
         # Try to get PDF-specific metadata
-        if PDF_AVAILABLE:
-            try:
-                with pdfplumber.open(file_path) as pdf:
-                    metadata.update({
-                        'page_count': len(pdf.pages),
-                        'pdf_metadata': pdf.metadata or {}
-                    })
-            except Exception as e:
-                logger.warning(f"Could not extract PDF metadata: {e}")
+        try:
+            page_count, pdf_metadata = _probe_pdf(os.path.abspath(file_path), stat.st_mtime_ns)
+            metadata.update({
+                'page_count': page_count,
+                'pdf_metadata': dict(pdf_metadata)
+            })
+        except Exception as e:
+            logger.warning(f"Could not extract PDF metadata: {e}")
         
         return metadata
 
@@ -217,59 +848,245 @@ class PDFExtractor(TextExtractorBase):
 class TextExtractionManager:
     """Manager class that handles different file types using appropriate extractors."""
     
-    def __init__(self):
-        """Initialize with default extractors."""
+    def __init__(self, cache_size: int = 256, ocr_cache_dir: Optional[str] = None):
+        """Initialize with default extractors.
+        
+        Args:
+            cache_size: Number of extracted texts kept in memory, keyed by file path,
+                modification time and size (0 disables caching)
+            ocr_cache_dir: Directory where the default PDF extractor keeps OCR results
+                between runs (default: no on-disk cache)
+        """
         self.extractors: List[TextExtractorBase] = []
+        self._cache_size = cache_size
+        self.ocr_cache_dir = ocr_cache_dir
+        # Extractors by extension, in registration order, plus those without declared extensions
+        self._by_ext: Dict[str, List[TextExtractorBase]] = {}
+        self._generic: List[TextExtractorBase] = []
+        # Bound extract methods with their extractor names, resolved once per extension
+        self._extract_fns: Dict[str, List[Tuple[str, Callable[..., str]]]] = {}
+        self._cached_extract = functools.lru_cache(maxsize=cache_size)(self._extract_cached)
         self.register_default_extractors()
     
+    def __getstate__(self):
+        # The lru_cache wrapper cannot be pickled; worker processes start with an empty cache
+        state = self.__dict__.copy()
+        del state['_cached_extract']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cached_extract = functools.lru_cache(maxsize=self._cache_size)(self._extract_cached)
+    
     def register_default_extractors(self):
         """Register the default set of extractors."""
-        self.extractors.append(TxtExtractor())
+        self._add_extractor(TxtExtractor())
         try:
-            self.extractors.append(PDFExtractor())
+            self._add_extractor(PDFExtractor(cache_dir=self.ocr_cache_dir))
         except ImportError as e:
             logger.warning(f"PDF extraction not available: {e}")
     
+    def _add_extractor(self, extractor: TextExtractorBase):
+        """Add an extractor to the registry and the extension dispatch table."""
+        self.extractors.append(extractor)
+        if self._dispatches_by_extension(extractor):
+            for ext in extractor.extensions:
+                self._by_ext.setdefault(ext.lower(), []).append(extractor)
+                self._extract_fns.setdefault(ext.lower(), []).append(
+                    (extractor.__class__.__name__, extractor.extract))
+        else:
+            self._generic.append(extractor)
+    
+    @staticmethod
+    def _dispatches_by_extension(extractor: TextExtractorBase) -> bool:
+        """Check whether an extractor's declared extensions describe every file it supports.
+        
+        A subclass that overrides supports_file below the class declaring the
+        extensions (e.g. a TxtExtractor subclass for '.md') keeps the inherited
+        tuple, so it must be asked through supports_file instead.
+        """
+        if not extractor.extensions:
+            return False
+        mro = type(extractor).__mro__
+        extensions_owner = next(i for i, cls in enumerate(mro) if 'extensions' in vars(cls))
+        supports_owner = next(i for i, cls in enumerate(mro) if 'supports_file' in vars(cls))
+        return extensions_owner <= supports_owner
+    
+    def _extractors_for(self, file_path: str) -> List[TextExtractorBase]:
+        """Return the extractors able to handle a file, in the order to try them."""
+        ext = os.path.splitext(file_path)[1].lower()
+        extractors = self._by_ext.get(ext, [])
+        if self._generic:
+            extractors = extractors + [e for e in self._generic if e.supports_file(file_path)]
+        return extractors
+    
     def register_extractor(self, extractor: TextExtractorBase):
         """Register a custom extractor."""
-        self.extractors.append(extractor)
+        self._add_extractor(extractor)
+        # A new extractor may handle files differently, so drop stale results
+        self.clear_cache()
     
-    def extract_text(self, file_path: str, **kwargs) -> str:
-        """Extract text from file using appropriate extractor."""
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+    def clear_cache(self):
+        """Forget all cached extraction results."""
+        self._cached_extract.cache_clear()
+    
+    def extract_text(self, file_path: Union[str, os.DirEntry], use_cache: bool = True, **kwargs) -> str:
+        """Extract text from file using appropriate extractor.
         
-        for extractor in self.extractors:
-            if extractor.supports_file(file_path):
-                try:
-                    return extractor.extract(file_path, **kwargs)
-                except Exception as e:
-                    logger.error(f"Extraction failed with {extractor.__class__.__name__}: {e}")
-                    continue
+        Results are cached per (path, modification time, size) and extraction
+        options, so unchanged files are not extracted again. An os.scandir()
+        entry may be passed instead of a path to reuse its cached stat.
+        
+        Args:
+            file_path: Path or os.scandir() entry of the file
+            use_cache: Whether to read and store the result in the in-memory cache;
+                streaming callers pass False so that cached texts do not pile up
+            **kwargs: Extraction options passed to the extractor
+        """
+        try:
+            file_path, stat = _stat_path(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {os.fspath(file_path)}")
+        
+        if not use_cache:
+            return self._extract_uncached(file_path, **kwargs)
+        file_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        if kwargs.get('out') is not None:
+            # Streamed output is written as a side effect, so it is never served from the cache
+            return self._extract_uncached(file_path, **kwargs)
+        options = tuple(sorted(kwargs.items()))
+        try:
+            hash(options)
+        except TypeError:
+            # Unhashable options cannot be part of the cache key
+            return self._extract_uncached(file_path, **kwargs)
+        return self._cached_extract(file_key, options)
+    
+    def extract_many(self, paths: Iterable[Union[str, os.DirEntry]], max_workers: Optional[int] = None,
+                     large_file_size: int = EXTRACT_MANY_LARGE_FILE_SIZE,
+                     **kwargs) -> Iterator[Tuple[str, str]]:
+        """Extract text from many files in parallel, one file per worker process.
+        
+        File-level parallelism suits batches of small and medium files, which are
+        extracted in the pool with num_workers=1 unless overridden, so workers do
+        not start nested pools. For a large PDF, page-level parallelism is the
+        better fit, so files above large_file_size are extracted after the pool
+        drains, one at a time in this process with their own page pools.
+        Files that fail are logged and skipped.
+        
+        Args:
+            paths: Files to extract, as paths or os.scandir() entries
+            max_workers: Worker processes (default: CPU count; 1 runs in this process)
+            large_file_size: Size in bytes above which a file is extracted on its own
+                with page-level parallelism (default: 10 MB)
+            **kwargs: Extraction options passed to extract_text
+        
+        Returns:
+            Iterator of (path, text) pairs in completion order
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        # Texts are handed straight to the caller, so keeping them cached would only hold memory
+        kwargs.setdefault('use_cache', False)
+        
+        small_paths, large_paths = [], []
+        for path in paths:
+            try:
+                size = _stat_path(path)[1].st_size
+            except OSError:
+                size = 0  # Extraction reports the error
+            (large_paths if size > large_file_size else small_paths).append(path)
+        
+        pool_kwargs = dict(kwargs)
+        pool_kwargs.setdefault('num_workers', 1)
+        if max_workers <= 1 or len(small_paths) < 2:
+            yield from self._extract_each(small_paths, pool_kwargs)
+        else:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(small_paths)),
+                                     initializer=_init_worker_manager, initargs=(self,)) as executor:
+                # Scandir entries cannot be pickled, so workers get plain paths
+                futures = {executor.submit(_extract_in_worker, os.fspath(path), pool_kwargs): path
+                           for path in small_paths}
+                for future in as_completed(futures):
+                    path = futures[future]
+                    try:
+                        yield path, future.result()
+                    except Exception as e:
+                        logger.error(f"Extraction failed for {path}: {e}")
+        
+        yield from self._extract_each(large_paths, kwargs)
+    
+    def _extract_each(self, paths: List[Union[str, os.DirEntry]],
+                      kwargs: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+        """Extract files one after another in this process, logging and skipping failures."""
+        for path in paths:
+            try:
+                yield path, self.extract_text(path, **kwargs)
+            except Exception as e:
+                logger.error(f"Extraction failed for {path}: {e}")
+    
+    def _extract_cached(self, file_key, options) -> str:
+        """Cache entry point for extract_text."""
+        return self._extract_uncached(file_key[0], **dict(options))
+    
+    def _extract_uncached(self, file_path: str, **kwargs) -> str:
+        """Extract text with the first supporting extractor that succeeds."""
+        ext = os.path.splitext(file_path)[1].lower()
+        extract_fns = self._extract_fns.get(ext, [])
+        if self._generic:
+            extract_fns = extract_fns + [(e.__class__.__name__, e.extract)
+                                         for e in self._generic if e.supports_file(file_path)]
+        
+        for name, extract in extract_fns:
+            try:
+                return extract(file_path, **kwargs)
+            except Exception as e:
+                logger.error(f"Extraction failed with {name}: {e}")
+                continue
         
         raise ValueError(f"No suitable extractor found for file: {file_path}")
     
-    def get_file_metadata(self, file_path: str) -> Dict[str, Any]:
-        """Get metadata for file."""
-        for extractor in self.extractors:
-            if extractor.supports_file(file_path):
-                return extractor.get_metadata(file_path)
+    def get_file_metadata(self, file_path: Union[str, os.DirEntry]) -> Dict[str, Any]:
+        """Get metadata for file, given as a path or an os.scandir() entry."""
+        for extractor in self._extractors_for(os.fspath(file_path)):
+            return extractor.get_metadata(file_path)
         return {}
     
     def get_supported_extensions(self) -> List[str]:
         """Get list of supported file extensions."""
-        extensions = []
-        # This is a simple implementation - could be improved
-        for extractor in self.extractors:
-            if isinstance(extractor, TxtExtractor):
-                extensions.extend(['.txt', '.text'])
-            elif isinstance(extractor, PDFExtractor):
-                extensions.append('.pdf')
-        return extensions
+        return list(self._by_ext)
+
+
+# Manager copy used by extract_many inside each worker process
+_WORKER_MANAGER: Optional[TextExtractionManager] = None
+
+
+def _init_worker_manager(manager: TextExtractionManager):
+    """Install the manager sent by extract_many in a worker process."""
+    global _WORKER_MANAGER
+    _WORKER_MANAGER = manager
+
+
+def _extract_in_worker(file_path: str, kwargs: Dict[str, Any]) -> str:
+    """Extract one file with the worker's manager (runs in a worker process)."""
+    return _WORKER_MANAGER.extract_text(file_path, **kwargs)
+
+
+_DEFAULT_MANAGER: Optional[TextExtractionManager] = None
+_DEFAULT_MANAGER_LOCK = threading.Lock()
+
+
+def _get_default_manager() -> TextExtractionManager:
+    """Return the shared manager used by the convenience function, creating it on first use."""
+    global _DEFAULT_MANAGER
+    if _DEFAULT_MANAGER is None:
+        with _DEFAULT_MANAGER_LOCK:
+            if _DEFAULT_MANAGER is None:
+                _DEFAULT_MANAGER = TextExtractionManager()
+    return _DEFAULT_MANAGER
 
 
 # Convenience function for simple use cases
 def extract_text_from_file(file_path: str, **kwargs) -> str:
     """Extract text from any supported file type."""
-    manager = TextExtractionManager()
-    return manager.extract_text(file_path, **kwargs)
\ No newline at end of file
+    return _get_default_manager().extract_text(file_path, **kwargs)
\ No newline at end of file
@@ -27,6 +27,9 @@ setup(name='emfdscore',
               'Pillow>=8.0.0',
               'PyMuPDF>=1.18.0'  # fitz module for PDF to image conversion
           ],
+          'fast': [
+              'orjson>=3.0.0'  # faster JSON output in moral_analyzer
+          ],
           'dev': [
               'reportlab>=3.0.0'  # for creating test PDFs
           ]
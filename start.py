@@ -74,8 +74,10 @@ Durand, an expert in the 3D laser scanning of structures, had arrived in Ukraine
         traceback.print_exc()
     finally:
         # Clean up temp file
-        if os.path.exists(temp_file):
+        try:
             os.unlink(temp_file)
+        except FileNotFoundError:
+            pass
 
     print("\n=== Analysis Complete ===")
     print("To avoid KeyError issues in the future:")
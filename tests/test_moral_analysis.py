@@ -0,0 +1,33 @@
+import pandas as pd
+
+from emfdscore.moral_analysis import MoralFrameworkAnalyzer
+
+
+def _fake_score_texts_bulk(texts, *args):
+    # One row per document, keyed by its text so the caller can check alignment
+    if any('boom' in text for text in texts):
+        raise RuntimeError('scoring failed')
+    return pd.DataFrame({'care_p': [float(len(text)) for text in texts], 'text': texts})
+
+
+def test_iter_analyze_keeps_input_order_and_isolates_errors(tmp_path, monkeypatch):
+    contents = ['care', None, 'fairness', '', 'loyalty', 'boom', 'authority', None, 'sanctity']
+    paths = []
+    for index, content in enumerate(contents):
+        path = tmp_path / f'doc_{index}.txt'
+        if content is not None:  # None leaves the file missing
+            path.write_text(content)
+        paths.append(str(path))
+    
+    analyzer = MoralFrameworkAnalyzer()
+    monkeypatch.setattr(analyzer, '_score_texts_bulk', _fake_score_texts_bulk)
+    results = list(analyzer.iter_analyze(iter(paths), max_workers=4, chunk_size=3))
+    
+    assert [result['file_path'] for result in results] == paths
+    failed = [index for index, result in enumerate(results) if 'error' in result]
+    # Missing and empty files fail on their own; a scoring failure takes down
+    # its chunk (doc_3 to doc_5) but not the chunks around it
+    assert failed == [1, 3, 4, 5, 7]
+    for index in set(range(len(contents))) - set(failed):
+        assert results[index]['moral_scores']['text'] == contents[index]
+        assert results[index]['moral_scores']['care_p'] == len(contents[index])
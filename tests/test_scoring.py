@@ -0,0 +1,53 @@
+import math
+
+import pytest
+
+spacy = pytest.importorskip('spacy')
+pd = pytest.importorskip('pandas')
+try:
+    from emfdscore import scoring
+except LookupError:
+    pytest.skip('NLTK stopwords are not installed', allow_module_level=True)
+
+
+DOCUMENTS = [
+    'They protect the weak and care for the sick, but the traitor would betray and cheat his kin.',
+    'Obey the law, honor the flag and keep the temple pure from sin and disgust.',
+    'The weather was mild on Tuesday.',
+    '',
+]
+
+CONFIGURATIONS = [
+    ('emfd', 'all', 'sentiment'),
+    ('emfd', 'single', 'sentiment'),
+    ('emfd', 'all', 'vice-virtue'),
+    ('emfd', 'single', 'vice-virtue'),
+    ('mfd', '', ''),
+    ('mfd2', '', ''),
+]
+
+
+def _blank_pipeline(component=None):
+    # The scoring pipes only read token text, so a blank pipeline stands in for en_core_web_sm
+    nlp = spacy.blank('en')
+    nlp.add_pipe('mfd_tokenizer')
+    if component is not None:
+        nlp.add_pipe(component, last=True)
+    return nlp
+
+
+def _same(a, b):
+    return a == b or (math.isnan(a) and math.isnan(b))
+
+
+@pytest.mark.parametrize('dic_type, prob_map, out_metrics', CONFIGURATIONS)
+def test_score_docs_single_matches_score_docs(dic_type, prob_map, out_metrics, monkeypatch):
+    monkeypatch.setattr(scoring, '_load_scoring_pipeline', _blank_pipeline)
+    df = scoring.score_docs(pd.DataFrame({0: DOCUMENTS}), dic_type, prob_map, 'bow',
+                            out_metrics, len(DOCUMENTS))
+    
+    for text, expected in zip(DOCUMENTS, df.to_dict('records')):
+        scores = scoring.score_docs_single(text, dic_type, prob_map, out_metrics)
+        assert list(scores) == list(expected)
+        for key, value in expected.items():
+            assert _same(scores[key], float(value)), key
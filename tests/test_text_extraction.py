@@ -0,0 +1,183 @@
+import io
+import os
+
+import pytest
+
+from emfdscore import text_extraction
+from emfdscore.text_extraction import PDFExtractor, TextExtractionManager, TxtExtractor
+
+
+def _make_pdf(path, image_pages=0, text_pages=0):
+    """Write a PDF with image-only pages followed by pages that have a text layer."""
+    fitz = pytest.importorskip('pymupdf')
+    from PIL import Image
+    
+    png = io.BytesIO()
+    Image.new('RGB', (200, 100), 'white').save(png, 'PNG')
+    pdf = fitz.open()
+    for _ in range(image_pages):
+        pdf.new_page().insert_image(fitz.Rect(50, 50, 250, 150), stream=png.getvalue())
+    for index in range(text_pages):
+        pdf.new_page().insert_text((72, 72), f'Page {index} speaks of care, fairness and loyalty.')
+    pdf.save(str(path))
+    return str(path)
+
+
+def test_latin1_text_is_not_misdetected(tmp_path):
+    # Short Latin-1 files must keep the fixed latin-1 fallback rather than a
+    # code page guessed from a few bytes (e.g. cp1250 turning 'ï' into 'ď')
+    samples = [
+        'café naïve',
+        'Il était très content de voir la forêt. Der Bär läuft über die Straße.',
+    ]
+    extractor = TxtExtractor()
+    for index, text in enumerate(samples):
+        path = tmp_path / f'latin1_{index}.txt'
+        path.write_bytes(text.encode('latin-1'))
+        assert extractor.extract(str(path)) == text
+        assert ''.join(extractor.iter_chunks(str(path))) == text
+
+
+def test_unknown_requested_encoding_raises(tmp_path):
+    path = tmp_path / 'note.txt'
+    path.write_bytes('café'.encode('utf-8'))
+    extractor = TxtExtractor()
+    with pytest.raises(LookupError):
+        extractor.extract(str(path), encoding='bogus')
+    with pytest.raises(LookupError):
+        ''.join(extractor.iter_chunks(str(path), encoding='bogus'))
+    with pytest.raises(LookupError):
+        extractor.extract(str(path), encoding='bogus', out=io.StringIO())
+
+
+def test_subclass_overriding_supports_file_is_dispatched(tmp_path):
+    # The subclass inherits TxtExtractor.extensions, so extension dispatch alone would skip it
+    class MarkdownExtractor(TxtExtractor):
+        def supports_file(self, file_path):
+            return file_path.lower().endswith('.md')
+    
+    path = tmp_path / 'note.md'
+    path.write_text('# note')
+    manager = TextExtractionManager()
+    manager.register_extractor(MarkdownExtractor())
+    assert manager.extract_text(str(path)) == '# note'
+    assert manager.get_file_metadata(str(path))['file_type'] == 'text'
+
+
+def test_text_layer_after_image_pages_is_extracted_when_ocr_fails(tmp_path, monkeypatch):
+    path = _make_pdf(tmp_path / 'mixed.pdf', image_pages=3, text_pages=2)
+    
+    def missing_tesseract(*args, **kwargs):
+        raise RuntimeError('tesseract is not installed')
+    
+    monkeypatch.setattr(text_extraction, 'OCR_AVAILABLE', True)
+    monkeypatch.setattr(text_extraction, '_ocr_image', missing_tesseract)
+    text = PDFExtractor().extract(path, num_workers=1)
+    assert 'Page 1 speaks of care' in text
+
+
+def test_scanned_pdf_goes_to_ocr_and_falls_back_to_text_backends(tmp_path, monkeypatch):
+    path = _make_pdf(tmp_path / 'scan.pdf', image_pages=2)
+    monkeypatch.setattr(text_extraction, 'OCR_AVAILABLE', True)
+    extractor = PDFExtractor()
+    
+    calls = []
+    monkeypatch.setattr(extractor, '_extract_with_ocr', lambda *args: calls.append('ocr') or ('scanned text', True))
+    assert extractor.extract(path) == 'scanned text'
+    assert calls == ['ocr']
+    
+    # If OCR fails, the text backends still run and OCR is not attempted twice
+    def failing_ocr(*args):
+        calls.append('ocr')
+        raise RuntimeError('tesseract is not installed')
+    
+    calls.clear()
+    monkeypatch.setattr(extractor, '_extract_with_ocr', failing_ocr)
+    monkeypatch.setattr(extractor, '_extract_with_pdfplumber', lambda *args: calls.append('pdfplumber') or ('', False))
+    with pytest.raises(ValueError):
+        extractor.extract(path)
+    assert calls == ['ocr', 'pdfplumber']
+
+
+def test_page_numbers_below_one_are_rejected(tmp_path):
+    path = _make_pdf(tmp_path / 'doc.pdf', text_pages=3)
+    extractor = PDFExtractor()
+    assert 'Page 1 speaks' in extractor.extract(path, pages=[2])
+    for pages in ([0], [-1], [1, 0]):
+        with pytest.raises(ValueError):
+            extractor.extract(path, pages=pages)
+        with pytest.raises(ValueError):
+            list(extractor.iter_pages(path, pages))
+
+
+def test_extract_many_keeps_page_pool_for_large_files(tmp_path, monkeypatch):
+    small = tmp_path / 'small.txt'
+    small.write_text('care')
+    large = tmp_path / 'large.txt'
+    large.write_text('fairness ' * 100)
+    manager = TextExtractionManager()
+    
+    calls = []
+    def fake_extract(path, **kwargs):
+        calls.append((path, kwargs.get('num_workers')))
+        return path
+    
+    monkeypatch.setattr(manager, 'extract_text', fake_extract)
+    results = list(manager.extract_many([str(large), str(tmp_path / 'missing.txt'), str(small)],
+                                        max_workers=1, large_file_size=100))
+    # Large files run last, without the num_workers=1 forced on pooled files
+    assert [path for path, _ in results] == [str(tmp_path / 'missing.txt'), str(small), str(large)]
+    assert calls[-1] == (str(large), None)
+    assert all(num_workers == 1 for _, num_workers in calls[:-1])
+
+
+def _count_extractions(manager, monkeypatch):
+    calls = []
+    extract_uncached = manager._extract_uncached
+    
+    def counting_extract(file_path, **kwargs):
+        calls.append(file_path)
+        return extract_uncached(file_path, **kwargs)
+    
+    monkeypatch.setattr(manager, '_extract_uncached', counting_extract)
+    return calls
+
+
+def test_cache_is_invalidated_when_mtime_or_size_changes(tmp_path, monkeypatch):
+    path = tmp_path / 'note.txt'
+    path.write_text('care')
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    manager = TextExtractionManager()
+    calls = _count_extractions(manager, monkeypatch)
+    
+    assert manager.extract_text(str(path)) == 'care'
+    assert manager.extract_text(str(path)) == 'care'
+    assert len(calls) == 1
+    
+    # Same size, new modification time
+    path.write_text('harm')
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert manager.extract_text(str(path)) == 'harm'
+    assert len(calls) == 2
+    
+    # New size, modification time restored
+    path.write_text('fairness')
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert manager.extract_text(str(path)) == 'fairness'
+    assert len(calls) == 3
+
+
+def test_use_cache_false_bypasses_the_cache(tmp_path, monkeypatch):
+    path = tmp_path / 'note.txt'
+    path.write_text('loyalty')
+    manager = TextExtractionManager()
+    calls = _count_extractions(manager, monkeypatch)
+    
+    assert manager.extract_text(str(path), use_cache=False) == 'loyalty'
+    assert manager.extract_text(str(path), use_cache=False) == 'loyalty'
+    assert len(calls) == 2
+    # Uncached calls neither read nor populate the cache
+    assert manager.extract_text(str(path)) == 'loyalty'
+    assert len(calls) == 3
+    assert manager.extract_text(str(path)) == 'loyalty'
+    assert len(calls) == 3